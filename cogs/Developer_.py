@@ -1,10 +1,12 @@
 #  -*- coding: utf-8 -*-
+import asyncio
 import os
-import pkgutil
+import re
 import sys
 import traceback
+import typing
 from enum import Enum
-from io import BytesIO
+from io import BytesIO, TextIOWrapper
 
 import disnake
 from disnake.ext import commands
@@ -25,6 +27,45 @@ class Action(str, Enum):
         return self.value
 
 
+ERROR_COLOUR = disnake.Colour(0xE74C3C)  # colour shared by every error embed of the cog.
+
+# Maps a cog action to the bot method that performs it and the message sent on success.
+_COG_ACTIONS = {
+    "disable": ("unload_extension", "has stopped running"),
+    "enable": ("load_extension", "is now running"),
+    "reload": ("reload_extension", "has been reloaded"),
+}
+
+_PLACEHOLDER_RE = re.compile(r"\{(users|guilds)\}")
+
+# Cached (name, lowercased name) pairs, refreshed whenever the modification time of ./cogs changes.
+_COG_NAMES_CACHE: typing.Optional[typing.List[typing.Tuple[str, str]]] = None
+_COG_DIR_MTIME: int = 0
+
+
+def _trace_file(error: Exception) -> disnake.File:
+    """
+    Writes the traceback of an error into an in-memory `error.log` file.
+
+    Parameters
+    ----------
+    error : Exception
+        The error whose traceback should be written.
+
+    Returns
+    -------
+    disnake.File
+        The file containing the traceback.
+    """
+    file = BytesIO()
+    wrapper = TextIOWrapper(file, encoding="utf-8", write_through=True)
+    traceback.print_exception(type(error), error, error.__traceback__, file=wrapper)
+    wrapper.detach()  # keep the BytesIO open once the wrapper is gone
+    file.seek(0)
+
+    return disnake.File(fp=file, filename="error.log")
+
+
 async def cog_autocomp(interaction: disnake.ApplicationCommandInteraction, user_input: str):
     """
     Autocomplete for the developer cog.
@@ -42,10 +83,20 @@ async def cog_autocomp(interaction: disnake.ApplicationCommandInteraction, user_
     list
         A list of possible completions according to the user input.
     """
-    cog_names = []
-    for pkg in pkgutil.iter_modules(["cogs"]):
-        cog_names.append(pkg.name)
-    return [item for item in cog_names if user_input.lower() in item]
+    global _COG_NAMES_CACHE, _COG_DIR_MTIME
+
+    mtime = os.stat("./cogs").st_mtime_ns
+    if _COG_NAMES_CACHE is None or mtime != _COG_DIR_MTIME:
+        with os.scandir("./cogs") as entries:
+            _COG_NAMES_CACHE = [
+                (entry.name[:-3], entry.name[:-3].lower())
+                for entry in entries
+                if entry.name.endswith(".py")
+            ]
+        _COG_DIR_MTIME = mtime
+
+    user_input = user_input.lower()
+    return [name for name, lowered in _COG_NAMES_CACHE if user_input in lowered]
 
 
 class Owner(commands.Cog, name="Developer"):
@@ -55,6 +106,60 @@ class Owner(commands.Cog, name="Developer"):
 
     def __init__(self, bot):
         self.bot = bot
+        self._icon_red = bot.icons["redtick"]
+        self._icon_info = bot.icons["info"]
+
+    def _expand(self, template: str) -> str:
+        """
+        Substitutes the `{users}` and `{guilds}` placeholders of a status template in a single pass.
+
+        Parameters
+        ----------
+        template : str
+            The status text entered by the user.
+
+        Returns
+        -------
+        str
+            The status text with the placeholders replaced by the bot's user and guild counts.
+        """
+
+        # Static statuses are the common case, so skip counting when there is nothing to replace.
+        values = {}
+        if "{users}" in template:
+            values["users"] = str(len(self.bot.users))
+        if "{guilds}" in template:
+            values["guilds"] = str(len(self.bot.guilds))
+        if not values:
+            return template
+
+        return _PLACEHOLDER_RE.sub(lambda match: values[match.group(1)], template)
+
+    async def _send_trace(
+        self,
+        interaction: disnake.ApplicationCommandInteraction,
+        error: Exception,
+        cog: str,
+    ) -> None:
+        """
+        Sends the traceback of an error as an `error.log` attachment.
+
+        Parameters
+        ----------
+        interaction : disnake.ApplicationCommandInteraction
+            The Interaction of the command.
+
+        error : Exception
+            The error whose traceback should be sent.
+
+        cog : str
+            The name of the cog that raised the error.
+        """
+        await interaction.response.send_message(
+            f"{self._icon_info} Cog **{cog}** has an error located in it.",
+            file=_trace_file(error),
+            ephemeral=True,
+        )
 
     async def cog_slash_command_error(
         self, interaction: disnake.ApplicationCommandInteraction, error: Exception
@@ -78,24 +183,26 @@ class Owner(commands.Cog, name="Developer"):
         if isinstance(error, commands.NotOwner):
             await safe_send(
                 embed=disnake.Embed(
-                    description=f"{self.bot.icons['redtick']} You are not the owner of this bot.",
-                    color=disnake.Colour.random(),
+                    description=f"{self._icon_red} You are not the owner of this bot.",
+                    color=ERROR_COLOUR,
                 ),
                 ephemeral=True,
             )
 
             # ignore all other exception types, but print them to stderr
         else:
-            error_msg = "".join(
-                traceback.format_exception(type(error), error, error.__traceback__)
-            )
+            # Only the exception summary goes in the embed, the full traceback is attached.
+            error_msg = "".join(traceback.format_exception_only(type(error), error))
+            author = str(interaction.author)
+            command_name = interaction.application_command.name
             await safe_send(
                 embed=disnake.Embed(
-                    description=f"**Error invoked by: {str(interaction.author)}**\n"
-                    f"Command: {interaction.application_command.name}\nError: "
+                    description=f"**Error invoked by: {author}**\n"
+                    f"Command: {command_name}\nError: "
                     f"```py\n{error_msg}```",
-                    color=disnake.Colour.random(),
-                )
+                    color=ERROR_COLOUR,
+                ),
+                file=_trace_file(error),
             )
 
             print(
@@ -142,74 +249,30 @@ class Owner(commands.Cog, name="Developer"):
         `/botconfig cog action: enable cog: Developer_`
         """
 
-        if action.lower() == "disable":
-
-            try:
-                self.bot.unload_extension(f"cogs.{cog}")
-            except Exception as e:
-                return await interaction.response.send_message(
-                    embed=disnake.Embed(
-                        description=f"Cog **{cog}** is not loaded.\nError:\n```py\n{e}\n```",
-                        color=disnake.Colour.random(),
-                    ),
-                    ephemeral=True,
-                )
+        try:
+            method_name, success_msg = _COG_ACTIONS[action.lower()]
+        except KeyError:
+            return await interaction.response.send_message(
+                f"{self._icon_red} `{action}` is not a supported action.",
+                ephemeral=True,
+            )
 
-            await interaction.response.send_message(
+        try:
+            getattr(self.bot, method_name)(f"cogs.{cog}")
+        except commands.ExtensionNotLoaded as e:
+            return await interaction.response.send_message(
                 embed=disnake.Embed(
-                    description=f"Cog **{cog}** has stopped running.",
-                    color=disnake.Colour.random(),
+                    description=f"Cog **{cog}** is not loaded.\nError:\n```py\n{e}\n```",
+                    color=ERROR_COLOUR,
                 ),
                 ephemeral=True,
             )
+        except Exception as error:
+            return await self._send_trace(interaction, error, cog)
 
-        elif action.lower() == "enable":
-
-            try:
-                self.bot.load_extension(f"cogs.{cog}")
-            except Exception as error:
-                with BytesIO() as file:
-                    trace = __import__("traceback").format_exception(
-                        etype=type(error), value=error, tb=error.__traceback__
-                    )
-                    file.write(bytes("".join(trace).encode("ascii")))
-                    file.seek(0)
-
-                    error_file = disnake.File(fp=file, filename="error.log")
-
-                return await interaction.response.send_message(
-                    f"{self.bot.icons['info']} This cog has an error located in it. ",
-                    file=error_file,
-                    ephemeral=True,
-                )
-
-            await interaction.response.send_message(
-                f"Cog **{cog}** is now running.", ephemeral=True
-            )
-
-        elif action.lower() == "reload":
-
-            try:
-                self.bot.reload_extension(f"cogs.{cog}")
-            except Exception as error:
-                with BytesIO() as file:
-                    trace = __import__("traceback").format_exception(
-                        etype=type(error), value=error, tb=error.__traceback__
-                    )
-                    file.write(bytes("".join(trace).encode("ascii")))
-                    file.seek(0)
-
-                    error_file = disnake.File(fp=file, filename="error.log")
-
-                return await interaction.response.send_message(
-                    f"{self.bot.icons['info']} This cog has an error located in it. ",
-                    file=error_file,
-                    ephemeral=True,
-                )
-
-            await interaction.response.send_message(
-                f"Cog **{cog}** has been reloaded.", ephemeral=True
-            )
+        await interaction.response.send_message(
+            f"Cog **{cog}** {success_msg}.", ephemeral=True
+        )
 
     @botconfig.sub_command(description="Shows cog information")
     async def coginfo(self, interaction: disnake.ApplicationCommandInteraction):
@@ -225,21 +288,18 @@ class Owner(commands.Cog, name="Developer"):
         --------
         `/coginfo`
         """
-        loaded_cogs = []
-        for cog in self.bot.extensions.keys():
-            cog_name = cog.split(".")
-            try:
-                loaded_cogs.append(f"{cog_name[1] + '.py'}")
-            except IndexError:
-                continue
-        print(loaded_cogs)
+        loaded_cogs = {
+            f"{cog.rsplit('.', 1)[1]}.py" for cog in self.bot.extensions if "." in cog
+        }
         unloaded = []
         cogs = 0
-        for file in os.listdir("./cogs"):
-            if file != "__pycache__":
+        with os.scandir("./cogs") as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    continue
                 cogs += 1
-                if file not in loaded_cogs:
-                    unloaded.append(file)
+                if entry.name not in loaded_cogs:
+                    unloaded.append(entry.name)
 
         embed = disnake.Embed(
             title="Loaded Cogs & Commands:", colour=disnake.Colour.random()
@@ -249,10 +309,6 @@ class Owner(commands.Cog, name="Developer"):
             value=f"**Total:** `{cogs}`\n**Loaded:** `{len(loaded_cogs)}`"
             f"\n**Unloaded:** `{', '.join(unloaded) or 'None!'}`",
         )
-        enabled, disabled, _commands = 0, 0, []
-        for command in self.bot.all_slash_commands:
-            cmd = self.bot.get_slash_command(command)
-            _commands.append(cmd.name)
         embed.add_field(
             name="Commands:",
             value=f"**Total commands:** `{len(self.bot.all_slash_commands)}`",
@@ -285,19 +341,34 @@ class Owner(commands.Cog, name="Developer"):
         await interaction.response.send_message(
             f"Deleting {amount} messages now...", ephemeral=True
         )
-        deleted = []
-        messages = []
-        async with interaction.channel.typing():
-            async for m in interaction.channel.history(limit=amount):
-                messages.append(m)
-                if m.author == self.bot.user:
-                    try:
-                        await m.delete()
-                    except Exception as error:
-                        self.bot.logger.error(error)
-                        pass
-                    else:
-                        deleted.append(m)
+        channel = interaction.channel
+        bot_messages = [
+            m async for m in channel.history(limit=amount) if m.author == self.bot.user
+        ]
+        # Bulk deletion needs Manage Messages and only exists on guild text channels and threads.
+        can_bulk_delete = (
+            isinstance(channel, (disnake.TextChannel, disnake.Thread))
+            and channel.permissions_for(channel.guild.me).manage_messages
+        )
+        # It also only accepts up to 100 messages younger than 14 days at a time.
+        step = 100 if can_bulk_delete else len(bot_messages) or 1
+        for i in range(0, len(bot_messages), step):
+            chunk = bot_messages[i : i + step]
+            if can_bulk_delete:
+                try:
+                    await channel.delete_messages(chunk)
+                    continue
+                except disnake.HTTPException as error:
+                    self.bot.logger.warning(
+                        "Bulk delete failed, deleting messages one by one: {}", error
+                    )
+
+            results = await asyncio.gather(
+                *(m.delete() for m in chunk), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    self.bot.logger.error(result)
 
     @commands.slash_command(
         name="setstatus",
@@ -343,9 +414,7 @@ class Owner(commands.Cog, name="Developer"):
         --------
         `/setstatus streaming url: https://www.twitch.tv/disnake game: disnake`
         """
-        game = game.replace("{users}", str(len(self.bot.users))).replace(
-            "{guilds}", str(len(self.bot.guilds))
-        )
+        game = self._expand(game)
         await self.bot.change_presence(
             activity=disnake.Streaming(
                 name=str(game), url=f"https://www.twitch.tv/{url}"
@@ -380,9 +449,7 @@ class Owner(commands.Cog, name="Developer"):
         `/setstatus playing game: disnake`
         """
 
-        game = game.replace("{users}", str(len(self.bot.users))).replace(
-            "{guilds}", str(len(self.bot.guilds))
-        )
+        game = self._expand(game)
         await self.bot.change_presence(activity=disnake.Game(name=game))
         await interaction.response.send_message(
             embed=disnake.Embed(
@@ -414,9 +481,7 @@ class Owner(commands.Cog, name="Developer"):
         `/setstatus watching game: disnake`
         """
 
-        game = game.replace("{users}", str(len(self.bot.users))).replace(
-            "{guilds}", str(len(self.bot.guilds))
-        )
+        game = self._expand(game)
         await self.bot.change_presence(
             activity=disnake.Activity(name=f"{game}", type=3)
         )
@@ -450,9 +515,7 @@ class Owner(commands.Cog, name="Developer"):
         `/setstatus listening game: disnake`
         """
 
-        game = game.replace("{users}", str(len(self.bot.users))).replace(
-            "{guilds}", str(len(self.bot.guilds))
-        )
+        game = self._expand(game)
         await self.bot.change_presence(
             activity=disnake.Activity(name=f"{game}", type=2)
         )
@@ -486,9 +549,7 @@ class Owner(commands.Cog, name="Developer"):
         `/setstatus competing game: disnake`
         """
 
-        game = game.replace("{users}", str(len(self.bot.users))).replace(
-            "{guilds}", str(len(self.bot.guilds))
-        )
+        game = self._expand(game)
         await self.bot.change_presence(
             activity=disnake.Activity(name=f"{game}", type=5)
         )
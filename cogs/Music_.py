@@ -13,7 +13,17 @@ from disnake.ext.commands.params import Param
 
 import wavelink
 from utils.helpers import ErrorView, LyricsPaginator, SearchService
-from utils.MusicPlayerInteraction import Player, QueuePages, Track
+from utils.MusicPlayerInteraction import (
+    VOTE_CLEAR,
+    VOTE_PAUSE,
+    VOTE_RESUME,
+    VOTE_SHUFFLE,
+    VOTE_SKIP,
+    VOTE_STOP,
+    Player,
+    QueuePages,
+    Track,
+)
 from utils.views import FilterView
 from utils.paginators import WrapText
 from wavelink.errors import FilterInvalidArgument
@@ -114,6 +124,25 @@ class Music(commands.Cog, wavelink.WavelinkMixin):
         self.bot.logger.info(f"Player stopped! {node}", __name="Music Bot")
         await payload.player.play_next_song()
 
+    @commands.Cog.listener("on_message")
+    async def menu_message_counter(self, message: disnake.Message):
+        """
+        Counts the messages sent after a player's song menu so it knows when to resend it.
+
+        Parameters
+        ----------
+        message : disnake.Message
+            The message that was sent.
+        """
+        if message.guild is None or not hasattr(self.bot, "wavelink"):
+            return
+
+        for node in self.bot.wavelink.nodes.values():
+            player = node.players.get(message.guild.id)
+            if isinstance(player, Player):
+                player.track_message(message)
+                return
+
     @commands.Cog.listener("on_voice_state_update")
     async def DJ_assign(
         self,
@@ -578,14 +607,12 @@ class Music(commands.Cog, wavelink.WavelinkMixin):
                 ),
                 delete_after=10,
             )
-            player.pause_votes.clear()
+            player.reset_votes(VOTE_PAUSE)
 
             return await player.set_pause(True)
 
         required = self.vote_check(interaction)
-        player.pause_votes.add(interaction.author)
-
-        if len(player.pause_votes) >= required:
+        if player.add_vote(interaction.author, VOTE_PAUSE) >= required:
             await interaction.response.send_message(
                 embed=disnake.Embed(
                     description=f"{self.bot.icons['greentick']} `Vote to pause passed. Pausing player.`",
@@ -593,7 +620,7 @@ class Music(commands.Cog, wavelink.WavelinkMixin):
                 ),
                 delete_after=10,
             )
-            player.pause_votes.clear()
+            player.reset_votes(VOTE_PAUSE)
             await player.set_pause(True)
         else:
             await interaction.response.send_message(
@@ -655,18 +682,16 @@ class Music(commands.Cog, wavelink.WavelinkMixin):
                 ),
                 delete_after=10,
             )
-            player.resume_votes.clear()
+            player.reset_votes(VOTE_RESUME)
 
             return await player.set_pause(False)
 
         required = self.vote_check(interaction)
-        player.resume_votes.add(interaction.author)
-
-        if len(player.resume_votes) >= required:
+        if player.add_vote(interaction.author, VOTE_RESUME) >= required:
             await interaction.response.send_message(
                 "Vote to resume passed. Resuming player.", delete_after=10
             )
-            player.resume_votes.clear()
+            player.reset_votes(VOTE_RESUME)
             await player.set_pause(False)
         else:
             await interaction.response.send_message(
@@ -709,18 +734,16 @@ class Music(commands.Cog, wavelink.WavelinkMixin):
                 ),
                 delete_after=10,
             )
-            player.skip_votes.clear()
+            player.reset_votes(VOTE_SKIP)
 
             return await player.stop()
 
         required = self.vote_check(interaction)
-        player.skip_votes.add(interaction.author)
-
-        if len(player.skip_votes) >= required:
+        if player.add_vote(interaction.author, VOTE_SKIP) >= required:
             await interaction.response.send_message(
                 "Vote to skip passed. Skipping song.", delete_after=10
             )
-            player.skip_votes.clear()
+            player.reset_votes(VOTE_SKIP)
             await player.stop()
         else:
             await interaction.response.send_message(
@@ -778,9 +801,7 @@ class Music(commands.Cog, wavelink.WavelinkMixin):
             return await player.teardown()
 
         required = self.vote_check(interaction)
-        player.stop_votes.add(interaction.author)
-
-        if len(player.stop_votes) >= required:
+        if player.add_vote(interaction.author, VOTE_STOP) >= required:
             await interaction.response.send_message(
                 embed=disnake.Embed(
                     description=f"{self.bot.icons['info']} Vote passed, stopping the player.",
@@ -1469,7 +1490,7 @@ class Music(commands.Cog, wavelink.WavelinkMixin):
             )
 
         entries = []
-        for track in player.queue._queue:
+        for track in player.queue.snapshot():
             entries.append(
                 f"[{track.title}]({track.uri}) - `{track.author}` - "
                 f"`{humanize.precisedelta(datetime.timedelta(milliseconds=track.length))}`"
@@ -1524,14 +1545,12 @@ class Music(commands.Cog, wavelink.WavelinkMixin):
                 )
             )
 
-            player.clear_votes.clear()
+            player.reset_votes(VOTE_CLEAR)
             player.queue.clear()
             return
 
         required = self.vote_check(interaction)
-        player.clear_votes.add(interaction.author)
-
-        if len(player.shuffle_votes) >= required:
+        if player.add_vote(interaction.author, VOTE_CLEAR) >= required:
             await interaction.response.send_message(
                 embed=disnake.Embed(
                     description=f"{self.bot.icons['info']} Vote passed, clearing the queue.",
@@ -1539,7 +1558,7 @@ class Music(commands.Cog, wavelink.WavelinkMixin):
                 )
             )
 
-            player.clear_votes.clear()
+            player.reset_votes(VOTE_CLEAR)
             player.queue.clear()
         else:
             return await interaction.response.send_message(
@@ -1664,13 +1683,11 @@ class Music(commands.Cog, wavelink.WavelinkMixin):
                 )
             )
 
-            player.shuffle_votes.clear()
+            player.reset_votes(VOTE_SHUFFLE)
             return player.queue.shuffle()
 
         required = self.vote_check(interaction)
-        player.shuffle_votes.add(interaction.author)
-
-        if len(player.shuffle_votes) >= required:
+        if player.add_vote(interaction.author, VOTE_SHUFFLE) >= required:
             await interaction.channel.send(
                 embed=disnake.Embed(
                     description=f"{self.bot.icons['info']} Vote passed, shuffling songs.",
@@ -1678,7 +1695,7 @@ class Music(commands.Cog, wavelink.WavelinkMixin):
                 )
             )
 
-            player.shuffle_votes.clear()
+            player.reset_votes(VOTE_SHUFFLE)
             player.queue.shuffle()
         else:
             return await interaction.channel.send(
@@ -12,6 +12,11 @@ import humanize
 import wavelink
 from utils.paginators import RichPager, ViewPages
 
+VOTE_PAUSE, VOTE_RESUME, VOTE_SKIP, VOTE_SHUFFLE, VOTE_STOP, VOTE_CLEAR = (
+    1 << i for i in range(6)
+)
+ALL_VOTES = (1 << 6) - 1
+
 
 class Track(wavelink.Track):
     """
@@ -33,7 +38,14 @@ class Queue(asyncio.Queue):
 
     def __getitem__(self, item):
         if isinstance(item, slice):
-            return list(itertools.islice(self._queue, item.start, item.stop, item.step))  # type: ignore
+            size = len(self._queue)  # type: ignore
+            indices = range(*item.indices(size))
+            if not indices:
+                return []
+            # Large slices are cheaper as one list copy than walking the deque with islice.
+            if len(indices) > size // 2 or indices.step < 0:
+                return list(self._queue)[item]  # type: ignore
+            return list(itertools.islice(self._queue, indices.start, indices.stop, indices.step))  # type: ignore
         else:
             return self._queue[item]  # type: ignore
 
@@ -46,6 +58,12 @@ class Queue(asyncio.Queue):
     def __repr__(self):
         return f"<Queue size: {self.qsize()}>"
 
+    def snapshot(self) -> typing.List[Track]:
+        """
+        A method that returns a copy of the queued tracks as a list.
+        """
+        return list(self._queue)  # type: ignore
+
     def clear(self):
         """
         A method that clears the queue.
@@ -55,14 +73,25 @@ class Queue(asyncio.Queue):
     def shuffle(self):
         """
         A method that shuffles the queue.
+        The tracks are shuffled in a temporary list, since indexing into the middle of a deque is O(n).
         """
-        random.shuffle(self._queue)  # type: ignore
+        tracks = list(self._queue)  # type: ignore
+        random.shuffle(tracks)
+        self._queue.clear()  # type: ignore
+        self._queue.extend(tracks)  # type: ignore
 
     def remove(self, index: int):
         """
         A method that removes a track from the queue.
+        Removing the first or last track is O(1), any other index is O(n).
         """
-        del self._queue[index]  # type: ignore
+        queue = self._queue  # type: ignore
+        if index == 0:
+            queue.popleft()
+        elif index in (-1, len(queue) - 1):
+            queue.pop()
+        else:
+            del queue[index]
 
 
 class Player(wavelink.Player):
@@ -70,6 +99,22 @@ class Player(wavelink.Player):
     Wavelink music player class.
     """
 
+    __slots__ = (
+        "context",
+        "dj",
+        "queue",
+        "menu",
+        "_messages_since_menu",
+        "_embed_template",
+        "_embed_track",
+        "channel",
+        "_loop",
+        "waiting",
+        "_menu_lock",
+        "now",
+        "_votes",
+    )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -79,19 +124,18 @@ class Player(wavelink.Player):
 
         self.queue = Queue()
         self.menu: disnake.Message = None  # type: ignore
+        self._messages_since_menu = 0
+        self._embed_template: typing.Optional[disnake.Embed] = None
+        self._embed_track: typing.Optional[Track] = None
         self.channel = self.context.channel
         self._loop = False
 
         self.waiting = False
-        self.updating = False
+        self._menu_lock = asyncio.Lock()
         self.now = None
 
-        self.pause_votes = set()
-        self.resume_votes = set()
-        self.skip_votes = set()
-        self.shuffle_votes = set()
-        self.stop_votes = set()
-        self.clear_votes = set()
+        # Maps a member's ID to a bitmask of the VOTE_* flags they have voted for.
+        self._votes: typing.Dict[int, int] = {}
 
     async def play_next_song(self) -> None:
         """
@@ -101,19 +145,19 @@ class Player(wavelink.Player):
             return
 
         # Clear the votes for a new song...
-        self.pause_votes.clear()
-        self.resume_votes.clear()
-        self.skip_votes.clear()
-        self.shuffle_votes.clear()
-        self.stop_votes.clear()
+        self.reset_votes(ALL_VOTES & ~VOTE_CLEAR)
 
         if not self._loop:
 
             try:
                 self.waiting = True
-                with async_timeout.timeout(120):
-                    track = await self.queue.get()
-                    self.now = track
+                if not self.queue.empty():
+                    # A track is already queued, no need to arm the timeout and wait.
+                    track = self.queue.get_nowait()
+                else:
+                    with async_timeout.timeout(120):
+                        track = await self.queue.get()
+                self.now = track
                 await self.play(track)
                 self.waiting = False
 
@@ -131,31 +175,29 @@ class Player(wavelink.Player):
         """
         Method which handles the song menu.
         """
-        if self.updating:
-            return
-
-        self.updating = True
-
-        if not self.menu:
-            self.menu = await self.channel.send(
-                embed=await self.make_song_embed()
-            )
-
-        elif not await self.is_menu_available():
-            try:
-                await self.menu.delete()
-            except disnake.HTTPException as e:
-                logger.warning(f"Failed to delete menu message: {e}")
-            except AttributeError as e:
-                logger.warning(f"Failed to delete menu message: {e}")
-
-            await self.channel.send(embed=await self.make_song_embed())
-
-        else:
-            embed = await self.make_song_embed()
-            await self.channel.send(content=None, embed=embed)
-
-        self.updating = False
+        # Concurrent callers wait for the current update instead of being dropped.
+        async with self._menu_lock:
+            if not self.menu:
+                self.menu = await self.channel.send(
+                    embed=await self.make_song_embed()
+                )
+                self._messages_since_menu = 0
+
+            elif not await self.is_menu_available():
+                try:
+                    await self.menu.delete()
+                except disnake.HTTPException as e:
+                    logger.warning("Failed to delete menu message: {}", e)
+                except AttributeError as e:
+                    logger.warning("Failed to delete menu message: {}", e)
+
+                self.menu = await self.channel.send(embed=await self.make_song_embed())
+                self._messages_since_menu = 0
+
+            else:
+                embed = await self.make_song_embed()
+                self.menu = await self.channel.send(content=None, embed=embed)
+                self._messages_since_menu = 0
 
     async def make_song_embed(self) -> typing.Optional[disnake.Embed]:
         """
@@ -170,10 +212,24 @@ class Player(wavelink.Player):
         if not track:
             return None
 
-        channel = self.bot.get_channel(int(self.channel_id))
         position = divmod(self.position, 60000)
         length = divmod(self.now.length, 60000)
         mode = "yes" if self._loop else "off"
+        position_value = (
+            f"`{int(position[0])}:{round(position[1] / 1000):02}/{int(length[0])}:{round(length[1] / 1000):02}`"
+        )
+
+        if self._embed_track is track:
+            # Only the volume, position, loop mode and DJ change while a track is playing.
+            embed = self._embed_template.copy()
+            embed.set_field_at(1, name="Volume", value=f"**`{self.volume}%`**")
+            embed.set_field_at(2, name="Position", value=position_value)
+            embed.set_field_at(3, name="Track on loop?", value=f"**`{mode}`**")
+            embed.set_field_at(5, name="DJ", value=self.dj.mention)
+            return embed
+
+        channel = self.bot.get_channel(int(self.channel_id))
+        duration = datetime.timedelta(milliseconds=int(track.length))
 
         embed = disnake.Embed(
             description=f"```css\nNow Playing:\n**{track.title}**```",
@@ -186,13 +242,10 @@ class Player(wavelink.Player):
 
         embed.add_field(
             name="Duration",
-            value=f"`{humanize.precisedelta(datetime.timedelta(milliseconds=int(track.length)))}`",
+            value=f"`{humanize.precisedelta(duration)}`",
         )
         embed.add_field(name="Volume", value=f"**`{self.volume}%`**")
-        embed.add_field(
-            name="Position",
-            value=f"`{int(position[0])}:{round(position[1] / 1000):02}/{int(length[0])}:{round(length[1] / 1000):02}`"
-        )
+        embed.add_field(name="Position", value=position_value)
         embed.add_field(name="Track on loop?", value=f"**`{mode}`**")
         embed.add_field(name="Channel", value=f"**`{channel}`**")
         embed.add_field(name="DJ", value=self.dj.mention)
@@ -203,7 +256,10 @@ class Player(wavelink.Player):
             icon_url=track.requester.display_avatar,
         )
 
-        return embed
+        self._embed_template = embed
+        self._embed_track = track
+
+        return embed.copy()
 
     async def is_menu_available(self) -> bool:
         """
@@ -214,30 +270,89 @@ class Player(wavelink.Player):
         bool
             Whether the player controller should be remade or updated.
         """
-        try:
-            async for message in self.context.channel.history(limit=10):
-                if message.id == self.menu.message.id:
-                    return True
-        except (disnake.HTTPException, AttributeError):
-            return False
+        return self.menu is not None and self._messages_since_menu < 10
 
-        return False
+    def track_message(self, message: disnake.Message) -> None:
+        """
+        Method which counts the messages sent in the player's channel after the song menu.
+
+        Parameters
+        ----------
+        message : disnake.Message
+            The message that was sent.
+        """
+        if self.menu is None or message.channel.id != self.channel.id:
+            return
+
+        # Snowflakes are time ordered, so this skips the menu itself and anything sent before it.
+        if message.id > self.menu.id:
+            self._messages_since_menu += 1
 
     async def teardown(self):
         """
         Method which handles the teardown(clearing and disconnection) of the player.
         """
-        try:
-            await self.menu.delete()
-        except disnake.HTTPException as e:
-            logger.warning(f"Failed to delete menu message: {e}")
-        except AttributeError:
-            logger.warning("Failed to delete menu message: No menu message")
+        menu = self.menu
+        if menu is not None:
+            try:
+                await menu.delete()
+            except disnake.HTTPException as e:
+                logger.debug("Failed to delete menu message: {}", e)
+            self.menu = None
 
         try:
             await self.destroy()
         except KeyError as e:
-            logger.warning(f"Failed to destroy player: {e}")
+            logger.warning("Failed to destroy player: {}", e)
+
+    def add_vote(self, member: disnake.Member, vote: int) -> int:
+        """
+        Method which registers a member's vote.
+
+        Parameters
+        ----------
+        member : disnake.Member
+            The member who voted.
+        vote : int
+            The VOTE_* flag the member voted for.
+
+        Returns
+        -------
+        int
+            The amount of members that have voted for this flag.
+        """
+        self._votes[member.id] = self._votes.get(member.id, 0) | vote
+        return self.vote_count(vote)
+
+    def vote_count(self, vote: int) -> int:
+        """
+        Method which returns the amount of members that have voted for a flag.
+
+        Parameters
+        ----------
+        vote : int
+            The VOTE_* flag to count.
+        """
+        return sum(1 for votes in self._votes.values() if votes & vote)
+
+    def reset_votes(self, votes: int = ALL_VOTES) -> None:
+        """
+        Method which clears the given votes of every member.
+
+        Parameters
+        ----------
+        votes : int
+            The VOTE_* flags to clear. Clears every vote by default.
+        """
+        if votes == ALL_VOTES:
+            self._votes.clear()
+            return
+
+        self._votes = {
+            member_id: remaining
+            for member_id, remaining in ((k, v & ~votes) for k, v in self._votes.items())
+            if remaining
+        }
 
     @property
     def loop(self):
@@ -1,12 +1,14 @@
 #  -*- coding: utf-8 -*-
+import collections
+import shutil
 import subprocess
 import threading
 
 from loguru import logger
 
-bash_command = (
-    "cd Lavalink && java -jar Lavalink.jar"  # command that needs to be run on shell.
-)
+lavalink_command = ["java", "-jar", "Lavalink.jar"]  # command that runs the Lavalink server.
+
+lavalink_directory = "Lavalink"  # directory the command is run from.
 
 BaseProgram = "java"  # checking that if Java is installed on the host's system or not.
 
@@ -15,32 +17,46 @@ def run_lavalink_process():
     """
     A function that runs the Lavalink server.
     """
-    process = subprocess.run(["which", BaseProgram], capture_output=True, text=True)
-    if process.returncode == 0:
+    location = shutil.which(BaseProgram)
+    if location is not None:
         logger.success(
-            f'The program "{BaseProgram}" is installed. Lavalink can be run.'
+            'The program "{}" is installed. Lavalink can be run.', BaseProgram
         )  # checking if Java is installed on the host
         # system.
-        logger.info(f"The location of {BaseProgram} is: {process.stdout}")
+        logger.info("The location of {} is: {}", BaseProgram, location)
+
+        # Lavalink's output is streamed line by line instead of being buffered for the lifetime of the
+        # bot. Only the last few lines are kept, to explain why it stopped.
+        process = subprocess.Popen(
+            lavalink_command,
+            cwd=lavalink_directory,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        last_lines = collections.deque(maxlen=20)
+        for line in process.stdout:
+            last_lines.append(line)
+            logger.opt(lazy=True).debug("Lavalink: {}", line.rstrip)
 
-        output = subprocess.run(
-            bash_command, shell=True, capture_output=True, text=True
-        )  # running the command on
-        # shell.
-        # and yes using shell kwarg can be dangerous.
-        if output.returncode == 0:
-            logger.success("Lavalink is running.")
+        returncode = process.wait()
+        if returncode == 0:
+            logger.success("Lavalink has stopped.")
 
-        if output.returncode == -2:
+        elif returncode == -2:
             return
 
         else:
-            logger.error(f"Lavalink is not running. Error: {output.stdout}")
+            logger.error(
+                "Lavalink is not running. Exit code: {}\n{}",
+                returncode,
+                "".join(last_lines),
+            )
     else:
         logger.error(
-            f"Sorry, {BaseProgram} is not installed in your system. Please install it in order to run Lavalink."
+            "Sorry, {} is not installed in your system. Please install it in order to run Lavalink.",
+            BaseProgram,
         )
-        print(process.stdout)
 
 
 def lavalink_alive():
@@ -4,11 +4,48 @@ __license__ = "MIT"
 __copyright__ = "Copyright 2019-2021 (c) PythonistaGuild"
 __version__ = "0.9.10"
 
-from .client import Client
-from .errors import *
-from .events import *
-from .player import *
-from .filters import *
-from .node import Node
-from .meta import WavelinkMixin
-from .websocket import WebSocket
+import importlib as _importlib
+
+# Public names are imported on first access (PEP 562) instead of when the package is imported.
+_lazy = {
+    "Client": ".client",
+    "WavelinkException": ".errors",
+    "NodeOccupied": ".errors",
+    "InvalidIDProvided": ".errors",
+    "ZeroConnectedNodes": ".errors",
+    "AuthorizationFailure": ".errors",
+    "BuildTrackError": ".errors",
+    "FilterInvalidArgument": ".errors",
+    "InvalidFilter": ".errors",
+    "TrackEnd": ".events",
+    "TrackException": ".events",
+    "TrackStuck": ".events",
+    "TrackStart": ".events",
+    "WebsocketClosed": ".events",
+    "Track": ".player",
+    "TrackPlaylist": ".player",
+    "Player": ".player",
+    "BaseFilter": ".filters",
+    "Node": ".node",
+    "WavelinkMixin": ".meta",
+    "WebSocket": ".websocket",
+}
+
+__all__ = list(_lazy)
+
+
+def __getattr__(name):
+    if name in _lazy:
+        module = _importlib.import_module(_lazy[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+
+    if f".{name}" in _lazy.values():
+        return _importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
@@ -163,6 +163,21 @@ class Player:
         The channel the player is connected to. Could be None if the player is not connected.
     """
 
+    __slots__ = (
+        "bot",
+        "guild_id",
+        "node",
+        "last_update",
+        "last_position",
+        "position_timestamp",
+        "_voice_state",
+        "volume",
+        "paused",
+        "current",
+        "channel_id",
+        "_new_track",
+    )
+
     def __init__(
         self,
         bot: Union[